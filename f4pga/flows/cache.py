@@ -17,12 +17,56 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from os import cpu_count
 from pathlib import Path
-from zlib import adler32 as zlib_adler32
-from json import dump as json_dump, load as json_load, JSONDecodeError
+from stat import S_ISDIR
+from time import time_ns
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from json import JSONDecodeError
 
 from f4pga.flows.common import sfprint
 
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as _json_dumps, loads as json_loads
+
+    def json_dumps(obj):
+        return _json_dumps(obj, separators=(",", ":")).encode()
+
+
+try:
+    from xxhash import xxh3_64 as _new_hasher
+
+    HASH_ALGORITHM = "xxh3_64"
+except ImportError:
+
+    def _new_hasher():
+        return blake2b(digest_size=16)
+
+    HASH_ALGORITHM = "blake2b"
+
+
+# Bump whenever the layout of the cache file or the meaning of stored hashes changes.
+F4CACHE_VERSION = 3
+
+HASH_BLOCK_SIZE = 1 << 16
+
+# Coarsest modification time granularity expected from filesystems (FAT stores mtime with 2 s resolution).
+# A file modified within this window after it was hashed may keep its mtime, so such stat records are not trusted.
+MTIME_GRANULARITY_NS = 2 * 10**9
+
+
+def _hash_file(path: Path):
+    """Calculate a checksum of file's contents, reading it in fixed-size blocks."""
+
+    hasher = _new_hasher()
+    with path.open("rb", buffering=0) as rfptr:
+        for block in iter(lambda: rfptr.read(HASH_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
 
 class F4Cache:
     """
@@ -32,6 +76,8 @@ class F4Cache:
     """
 
     hashes: "dict[str, dict[str, str]]"
+    # Maps paths to `[size, mtime_ns, hash, stat_time_ns]` recorded when the file was last hashed.
+    file_stats: "dict[str, list]"
     current_hashes: "dict[str, str]"
     status: "dict[str, str]"
     cachefile_path: str
@@ -66,17 +112,62 @@ class F4Cache:
             self.status[path] = {}
         self.status[path][consumer] = status
 
+    def _compute_hash(self, path: Path):
+        """
+        Calculate hash of a file without modifying the state of the cache, so it can be run from worker threads.
+        Returns a tuple of file's posix path, its hash and a new stat record (or `None` if the file wasn't rehashed).
+        """
+
+        # A single `stat` answers every question asked about the file here, avoiding separate `is_dir`/`is_file`
+        # probes, which is noticeable on network filesystems.
+        stat_time = time_ns()
+        st = path.stat()
+
+        posix_path = path.as_posix()
+
+        if S_ISDIR(st.st_mode):
+            # Directories always get '0' hash.
+            return posix_path, "0", None
+
+        # Skip reading the file if neither its size nor modification time changed since it was last hashed.
+        # This is only done if the file had been last modified well before it was hashed, otherwise a later change
+        # of the same size could have left the (coarse) modification time intact.
+        last_stat = self.file_stats.get(posix_path)
+        if (
+            last_stat is not None
+            and last_stat[0] == st.st_size
+            and last_stat[1] == st.st_mtime_ns
+            and last_stat[1] + MTIME_GRANULARITY_NS < last_stat[3]
+        ):
+            return posix_path, last_stat[2], None
+
+        hash = _hash_file(path)
+        return posix_path, hash, [st.st_size, st.st_mtime_ns, hash, stat_time]
+
+    def _store_hash(self, posix_path: str, hash: str, file_stat):
+        if file_stat is not None:
+            self.file_stats[posix_path] = file_stat
+        self.current_hashes[posix_path] = hash
+
     def process_file(self, path: Path):
         """Process file for tracking with f4cache."""
 
-        if path.is_dir():
-            # Directories always get '0' hash.
-            hash = 0
-        else:
-            with path.open("rb") as rfptr:
-                hash = zlib_adler32(rfptr.read())
+        self._store_hash(*self._compute_hash(path))
+
+    def process_files(self, paths: "list[Path]"):
+        """
+        Process multiple files for tracking with f4cache.
+        Files are hashed concurrently, hashing functions release the GIL while processing data.
+        """
+
+        if len(paths) < 2:
+            for path in paths:
+                self.process_file(path)
+            return
 
-        self.current_hashes[path.as_posix()] = hash
+        with ThreadPoolExecutor(max_workers=min(len(paths), cpu_count() or 1)) as executor:
+            for result in executor.map(self._compute_hash, paths):
+                self._store_hash(*result)
 
     def update(self, path: Path, consumer: str):
         """Add/remove a file to.from the tracked files, update checksum if necessary and calculate status.
@@ -130,25 +221,60 @@ class F4Cache:
     def load(self):
         """Loads cache's state from the persistent storage"""
 
+        self.hashes = {}
+        self.file_stats = {}
+
         try:
-            with Path(self.cachefile_path).open("r") as rfptr:
-                self.hashes = json_load(rfptr)
+            # `orjson.JSONDecodeError` is a subclass of `json.JSONDecodeError`, so both backends are handled below.
+            data = json_loads(Path(self.cachefile_path).read_bytes())
         except JSONDecodeError:
             sfprint(
                 0,
                 f"WARNING: `{self.cachefile_path}` f4cache is corrupted!\n"
                 "This will cause flow to re-execute from the beginning.",
             )
-            self.hashes = {}
+            return
         except FileNotFoundError:
             sfprint(
                 0,
                 f"Couldn't open `{self.cachefile_path}` cache file.\n"
                 "This will cause flow to re-execute from the beginning.",
             )
-            self.hashes = {}
+            return
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != F4CACHE_VERSION
+            or data.get("algorithm") != HASH_ALGORITHM
+        ):
+            sfprint(
+                0,
+                f"`{self.cachefile_path}` f4cache was created by a different version of F4PGA.\n"
+                "This will cause flow to re-execute from the beginning.",
+            )
+            return
+
+        self.hashes = data["hashes"]
+        self.file_stats = data.get("stats", {})
 
     def save(self):
         """Saves cache's state to the persistent storage."""
-        with Path(self.cachefile_path).open("w") as wfptr:
-            json_dump(self.hashes, wfptr, indent=4)
+
+        # Don't keep stats of files which are no longer tracked.
+        file_stats = {
+            path: file_stat
+            for path, file_stat in self.file_stats.items()
+            if path in self.hashes or path in self.current_hashes
+        }
+
+        with Path(self.cachefile_path).open("wb") as wfptr:
+            wfptr.write(
+                json_dumps(
+                    {
+                        "version": F4CACHE_VERSION,
+                        "algorithm": HASH_ALGORITHM,
+                        "hashes": self.hashes,
+                        "stats": file_stats,
+                    }
+                )
+            )
@@ -107,10 +107,9 @@ class Flow:
 
     @staticmethod
     def _cache_deps(path: str, f4cache: F4Cache):
-        def _process_dep_path(path: str, f4cache: F4Cache):
-            f4cache.process_file(Path(path))
-
-        deep(_process_dep_path)(path, f4cache)
+        dep_paths = []
+        deep(lambda p: dep_paths.append(Path(p)))(path)
+        f4cache.process_files(dep_paths)
 
     def _dep_will_differ(self, dep: str, paths, consumer: str):
         """
@@ -23,39 +23,42 @@ from f4pga.flows.module import Module
 from f4pga.flows.common import decompose_depname
 
 
-def p_get_if_qualifier(deplist: "list[str]", qualifier: str):
+def p_group_by_qualifier(deplist: "list[str]") -> "dict[str, list[str]]":
+    """
+    Decompose each dependency name once and group the formatted entries by their qualifiers.
+    """
+    groups = {"req": [], "maybe": [], "demand": []}
     for dep_name in deplist:
         name, q = decompose_depname(dep_name)
-        if q == qualifier:
-            yield f"● {Style.BRIGHT}{name}{Style.RESET_ALL}"
+        groups[q].append(f"● {Style.BRIGHT}{name}{Style.RESET_ALL}")
+    return groups
 
 
-def p_list_if_qualifier(deplist: "list[str]", qualifier: str, indent: int = 4):
-    indent_str = "".join([" " for _ in range(0, indent)])
-    r = ""
-
-    for line in p_get_if_qualifier(deplist, qualifier):
-        r += indent_str + line + "\n"
-
-    return r
+def p_list_if_qualifier(groups: "dict[str, list[str]]", qualifier: str, indent: int = 4):
+    indent_str = " " * indent
+    return "".join(f"{indent_str}{line}\n" for line in groups[qualifier])
 
 
 def get_module_info(module: Module) -> str:
+    takes = p_group_by_qualifier(module.takes)
+    values = p_group_by_qualifier(module.values)
+    produces = p_group_by_qualifier(module.produces)
+
     r = ""
     r += f"Module `{Style.BRIGHT}{module.name}{Style.RESET_ALL}`:\n"
     r += "Inputs:\n  Required:\n    Dependencies\n"
-    r += p_list_if_qualifier(module.takes, "req", indent=6)
+    r += p_list_if_qualifier(takes, "req", indent=6)
     r += "    Values:\n"
-    r += p_list_if_qualifier(module.values, "req", indent=6)
+    r += p_list_if_qualifier(values, "req", indent=6)
     r += "  Optional:\n    Dependencies:\n"
-    r += p_list_if_qualifier(module.takes, "maybe", indent=6)
+    r += p_list_if_qualifier(takes, "maybe", indent=6)
     r += "    Values:\n"
-    r += p_list_if_qualifier(module.values, "maybe", indent=6)
+    r += p_list_if_qualifier(values, "maybe", indent=6)
     r += "Outputs:\n  Guaranteed:\n"
-    r += p_list_if_qualifier(module.produces, "req", indent=4)
+    r += p_list_if_qualifier(produces, "req", indent=4)
     r += "  On-demand:\n"
-    r += p_list_if_qualifier(module.produces, "demand", indent=4)
+    r += p_list_if_qualifier(produces, "demand", indent=4)
     r += "  Not guaranteed:\n"
-    r += p_list_if_qualifier(module.produces, "maybe", indent=4)
+    r += p_list_if_qualifier(produces, "maybe", indent=4)
 
     return r
@@ -93,12 +93,14 @@ class ModuleContext:
         """
         Add attribute for a dependency or panic if a required dependency has not been given to the module on its input.
         """
+        resolved = {}
         for name in deps:
             name, spec = decompose_depname(name)
             value = deps_cfg.get(name)
             if value is None and spec == "req":
                 fatal(-1, f"Dependency `{name}` is required by module `{self.module_name}` but wasn't provided")
-            setattr(obj, name, self.r_env.resolve(value))
+            resolved[name] = self.r_env.resolve(value)
+        obj.__dict__.update(resolved)
 
     # `config` should be a dictionary given as modules input.
     def __init__(self, module: Module, config: "dict[str, ]", r_env: ResolutionEnv, share: str, bin: str):
@@ -115,8 +117,7 @@ class ModuleContext:
         self._getreqmaybe(self.values, module.values, config["values"])
 
         produces_resolved = self.r_env.resolve(config["produces"])
-        for name, value in produces_resolved.items():
-            setattr(self.produces, name, value)
+        self.produces.__dict__.update(produces_resolved)
 
         outputs = module.map_io(self)
         outputs.update(produces_resolved)
@@ -126,16 +127,7 @@ class ModuleContext:
     def shallow_copy(self):
         cls = type(self)
         mycopy = cls.__new__(cls)
-
-        mycopy.module_name = self.module_name
-        mycopy.takes = self.takes
-        mycopy.produces = self.produces
-        mycopy.values = self.values
-        mycopy.outputs = self.outputs
-        mycopy.r_env = self.r_env
-        mycopy.share = self.share
-        mycopy.bin = self.bin
-
+        mycopy.__dict__ = self.__dict__.copy()
         return mycopy
 
 
@@ -153,13 +145,9 @@ def get_mod_metadata(module: Module):
     """
     Get descriptions for produced dependencies.
     """
+    prod_meta = getattr(module, "prod_meta", None) or {}
     meta = {}
-    has_meta = hasattr(module, "prod_meta")
     for prod in module.produces:
-        prod = prod.replace("?", "").replace("!", "")
-        if not has_meta:
-            meta[prod] = "<no descritption>"
-            continue
-        prod_meta = module.prod_meta.get(prod)
-        meta[prod] = prod_meta if prod_meta else "<no description>"
+        name, _ = decompose_depname(prod)
+        meta[name] = prod_meta.get(name) or "<no description>"
     return meta
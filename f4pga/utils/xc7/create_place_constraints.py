@@ -40,20 +40,72 @@ HEADER_TEMPLATE = """\
 #{name:<{nl}} x   y   z    pcf_line
 #{s:-^{nl}} --  --  -    ----"""
 
-CONSTRAINT_TEMPLATE = "{name:<{nl}} {x: 3} {y: 3} {z: 2}  # {comment}"
+# Output place files are written through a large buffer, so that writing them takes only a few syscalls.
+PLACE_FILE_BUFFER_SIZE = 1 << 20
 
 
-def get_root_cluster(curr):
-    while True:
-        parent = curr.getparent()
-        if parent is None:
-            return None
+def format_constraint(constraint, nl):
+    """Formats a `PlaceConstraint` as a line of a .place file, with the name padded to `nl` characters."""
+    return f"{constraint.name:<{nl}} {constraint.x: 3} {constraint.y: 3} {constraint.z: 2}  # {constraint.comment}"
 
-        parent_parent = parent.getparent()
-        if parent_parent is None:
-            return curr
 
-        curr = parent
+class NetFileTarget(object):
+    """
+    lxml parser target collecting the data needed from a .net file without building its DOM.
+
+    Collects:
+        * block_to_root_block - maps names of blocks to names of their top-level blocks (clusters),
+        * block_to_loc - maps names of top-level blocks to their LOC attributes,
+        * blocks - [instance, root cluster name, has children] entries, in document order.
+    """
+
+    def __init__(self):
+        self.block_to_root_block = dict()
+        self.block_to_loc = dict()
+        self.blocks = list()
+
+        # Names of the blocks enclosing the current element. The netlist root is at index 0, so the top-level block
+        # (cluster) is always at index 1.
+        self.block_names = list()
+        # One entry per open element, holding the `blocks` entry for blocks and None for other elements.
+        self.elements = list()
+        self.loc_text = None
+
+    def start(self, tag, attrib):
+        if self.elements and self.elements[-1] is not None:
+            self.elements[-1][2] = True
+
+        if tag == "block":
+            self.block_names.append(attrib["name"])
+            entry = None
+            if len(self.block_names) > 1:
+                root_name = self.block_names[1]
+                self.block_to_root_block[attrib["name"]] = root_name
+                entry = [attrib["instance"], root_name, False]
+                self.blocks.append(entry)
+            self.elements.append(entry)
+            return
+
+        if tag == "attribute" and attrib["name"] == "LOC" and len(self.block_names) > 1:
+            self.loc_text = []
+
+        self.elements.append(None)
+
+    def data(self, data):
+        if self.loc_text is not None:
+            self.loc_text.append(data)
+
+    def end(self, tag):
+        self.elements.pop()
+
+        if tag == "block":
+            self.block_names.pop()
+        elif tag == "attribute" and self.loc_text is not None:
+            self.block_to_loc[self.block_names[1]] = "".join(self.loc_text) or None
+            self.loc_text = None
+
+    def close(self):
+        return self
 
 
 class PlaceConstraints(object):
@@ -61,8 +113,9 @@ class PlaceConstraints(object):
         self.constraints = OrderedDict()
         self.block_to_loc = dict()
 
-        net_xml = ET.parse(net_file)
-        self.net_root = net_xml.getroot()
+        # Only names, instances and LOC attributes of blocks are needed, so collect them while parsing instead of
+        # keeping the whole netlist tree in memory.
+        self.net = ET.parse(net_file, ET.XMLParser(target=NetFileTarget()))
 
     def load_loc_sites_from_net_file(self):
         """
@@ -70,26 +123,8 @@ class PlaceConstraints(object):
         build a mapping from net names to block names from the .net file.
         """
         self.net_to_block = {}
-        self.block_to_root_block = {}
-
-        for el in self.net_root.iter("block"):
-            root_block = get_root_cluster(el)
-            if root_block is not None:
-                self.block_to_root_block[el.attrib["name"]] = root_block.attrib["name"]
-
-        for attr in self.net_root.xpath("//attribute"):
-            name = attr.attrib["name"]
-            if name != "LOC":
-                continue
-
-            # Get block name
-            top_block = attr.getparent()
-            assert top_block is not None
-            while top_block.getparent() is not self.net_root:
-                assert top_block is not None
-                top_block = top_block.getparent()
-
-            self.block_to_loc[top_block.get("name")] = attr.text
+        self.block_to_root_block = dict(self.net.block_to_root_block)
+        self.block_to_loc.update(self.net.block_to_loc)
 
     def constrain_block(self, block_name, loc, comment=""):
         assert len(loc) == 3
@@ -114,6 +149,7 @@ class PlaceConstraints(object):
         max_name_length = max(len(c.name) for c in self.constraints.values())
 
         constrained_blocks = {}
+        lines = []
 
         for vpr_net, constraint in self.constraints.items():
             name = constraint.name
@@ -134,21 +170,15 @@ class PlaceConstraints(object):
 
             # omit if no corresponding block name for the net
             if name is not None:
-                print(
-                    CONSTRAINT_TEMPLATE.format(
-                        name=name,
-                        nl=max_name_length,
-                        x=constraint.x,
-                        y=constraint.y,
-                        z=constraint.z,
-                        comment=constraint.comment,
-                    ),
-                    file=f,
-                )
+                lines.append(format_constraint(constraint, max_name_length))
 
                 # Add to constrained block list
                 constrained_blocks[name] = constraint
 
+        # Write all constraints at once instead of issuing a write per line
+        if lines:
+            f.write("\n".join(lines) + "\n")
+
     def get_loc_sites(self):
         """Yields user-constraints (block, location) pairs"""
 
@@ -180,11 +210,9 @@ class PlaceConstraints(object):
 
         instances = list()
 
-        for el in self.net_root.iter("block"):
-            inst = el.attrib["instance"]
-            if instance in inst:
-                if len(el.getchildren()) != 0:
-                    instances.append(get_root_cluster(el).attrib["name"])
+        for inst, root_name, has_children in self.net.blocks:
+            if instance in inst and has_children:
+                instances.append(root_name)
 
         return instances
 
@@ -1128,7 +1156,7 @@ def main(
         part=part,
         blif=Path(blif).open("r"),
         input=sys.stdin if input is None else Path(input).open("r"),
-        output=sys.stdout if output is None else Path(output).open("w"),
+        output=sys.stdout if output is None else Path(output).open("w", buffering=PLACE_FILE_BUFFER_SIZE),
         roi=roi,
         allow_bufg_logic_sources=allow_bufg_logic_sources,
         graph_limit=graph_limit,
@@ -1144,7 +1172,7 @@ if __name__ == "__main__":
         "--output",
         "-o",
         "-O",
-        type=argparse.FileType("w"),
+        type=argparse.FileType("w", bufsize=PLACE_FILE_BUFFER_SIZE),
         default=sys.stdout,
         help="The output constraints place file",
     )
@@ -37,11 +37,6 @@ isQuickLogic = FPGA_FAM != "xc7"
 SH_SUBDIR = "quicklogic" if isQuickLogic else FPGA_FAM
 
 
-if not isQuickLogic:
-    from f4pga.utils.xc7.create_ioplace import main as xc7_create_ioplace
-    from f4pga.utils.xc7.create_place_constraints import main as xc7_create_place_constraints
-
-
 # Helper functions
 
 
@@ -474,6 +469,10 @@ fi
 """
         )
     else:
+        # Imported here, as these pull in prjxray and lxml, which are not needed by the other wrappers.
+        from f4pga.utils.xc7.create_ioplace import main as xc7_create_ioplace
+        from f4pga.utils.xc7.create_place_constraints import main as xc7_create_place_constraints
+
         (eblif, net, part, device, arch_def) = sys_argv[1:6]
         ioplace_file = f"{Path(eblif).stem}.ioplace"
         xc7_create_ioplace(
@@ -65,12 +65,21 @@ case "$FPGA_FAM" in
     exit 1
 esac
 
+# Packages unpack into disjoint subtrees, so they are fetched and extracted concurrently
+PIDS=''
 for PKG in $PACKAGES; do
-  wget -qO- https://storage.googleapis.com/symbiflow-arch-defs/artifacts/prod/foss-fpga-tools/symbiflow-arch-defs/continuous/install/${F4PGA_TIMESTAMP}/symbiflow-arch-defs-${PKG}-${F4PGA_HASH}.tar.xz \
-    | tar -xJC $F4PGA_INSTALL_DIR_FAM
+  (
+    set -o pipefail
+    wget -qO- https://storage.googleapis.com/symbiflow-arch-defs/artifacts/prod/foss-fpga-tools/symbiflow-arch-defs/continuous/install/${F4PGA_TIMESTAMP}/symbiflow-arch-defs-${PKG}-${F4PGA_HASH}.tar.xz \
+      | xz -d -T0 \
+      | tar -xC $F4PGA_INSTALL_DIR_FAM --exclude='share/f4pga/scripts'
+  ) &
+  PIDS="$PIDS $!"
 done
 
-rm -vrf $F4PGA_INSTALL_DIR_FAM/share/f4pga/scripts
+for PID in $PIDS; do
+  wait $PID
+done
 
 echo '::endgroup::'
 